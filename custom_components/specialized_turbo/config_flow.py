@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+import time
 from typing import Any
 
 from bleak import BleakClient
@@ -13,14 +15,36 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_ble_device_from_address,
     async_discovered_service_info,
+    async_last_service_info,
 )
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.selector import (
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+)
+from homeassistant.util.hass_dict import HassKey
 
-from .const import CONF_PIN, DOMAIN
+from .const import CONF_PIN, DOMAIN, SPECIALIZED_COMPANY_IDS
 from specialized_turbo import is_specialized_advertisement
 
+_PIN_SCHEMA = vol.Schema({vol.Optional(CONF_PIN): str})
+
+# A connectable advertisement newer than this (seconds) counts as reachable
+_FRESH_ADVERTISEMENT_AGE = 30
+
+# Repeat discoveries of the same bike within this window (seconds) are dropped
+_DISCOVERY_DEDUP_WINDOW = 5
+
+# Normalized address -> monotonic time of the last Bluetooth discovery.
+# Several scanners can report the same bike in quick succession.
+_RECENT_DISCOVERIES: HassKey[dict[str, float]] = HassKey(f"{DOMAIN}_recent_discoveries")
+
+# Bound once so the per-advertisement prefilter is a single global lookup
+_lacks_specialized_company_id = SPECIALIZED_COMPANY_IDS.isdisjoint
+
 
 class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Specialized Turbo bikes."""
@@ -30,10 +54,24 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovery_info: BluetoothServiceInfoBleak | None = None
-        self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        # Address -> display name; only the name is needed to render the form
+        self._discovered_devices: dict[str, str] = {}
+        # Bumped whenever _discovered_devices gains a device so the user
+        # step schema is only rebuilt when its options actually change.
+        self._discovered_version = 0
+        self._user_schema: vol.Schema | None = None
+        self._user_schema_version = -1
 
     async def _async_test_connection(self, address: str) -> bool:
         """Attempt a BLE connection to verify the device is reachable."""
+        # Skip the connect round-trip if the bike has just been heard from
+        service_info = async_last_service_info(self.hass, address, connectable=True)
+        if (
+            service_info is not None
+            and time.monotonic() - service_info.time < _FRESH_ADVERTISEMENT_AGE
+        ):
+            return True
+
         ble_device = async_ble_device_from_address(self.hass, address, connectable=True)
         if ble_device is None:
             return False
@@ -48,8 +86,24 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> ConfigFlowResult:
         """Handle a Bluetooth discovery."""
-        await self.async_set_unique_id(format_mac(discovery_info.address))
+        unique_id = format_mac(discovery_info.address)
+        now = time.monotonic()
+        recent = self.hass.data.setdefault(_RECENT_DISCOVERIES, {})
+        # Drop expired entries so bikes that pass by once are not kept forever
+        for address, seen_at in list(recent.items()):
+            if now - seen_at >= _DISCOVERY_DEDUP_WINDOW:
+                del recent[address]
+        # async_set_unique_id would abort a duplicate too, but only after
+        # walking the in-progress flows and config entries; a burst from
+        # several scanners can skip that with a dict lookup.
+        if unique_id in recent:
+            return self.async_abort(reason="already_in_progress")
+
+        await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured()
+        # Only bikes that can still be set up are tracked, so advertisements
+        # from configured ones do not keep refreshing the table.
+        recent[unique_id] = now
 
         self._discovery_info = discovery_info
         self.context["title_placeholders"] = {
@@ -80,11 +134,7 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="bluetooth_confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_PIN): str,
-                }
-            ),
+            data_schema=_PIN_SCHEMA,
             description_placeholders={
                 "name": self._discovery_info.name or "Specialized Turbo",
                 "address": self._discovery_info.address,
@@ -108,7 +158,7 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 pin_str = user_input.get(CONF_PIN)
                 return self.async_create_entry(
-                    title=self._discovered_devices[address].name or "Specialized Turbo",
+                    title=self._discovered_devices[address],
                     data={
                         CONF_ADDRESS: address,
                         CONF_PIN: int(pin_str) if pin_str else None,
@@ -117,31 +167,53 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # Discover available Specialized bikes
         current_addresses = self._async_current_ids()
+        discovered = self._discovered_devices
+        # The same device can be reported by several scanners/proxies;
+        # only check each address once per render.
+        seen = set(discovered)
         for info in async_discovered_service_info(self.hass):
-            if format_mac(info.address) in current_addresses:
+            address = info.address
+            if address in seen:
+                continue
+            seen.add(address)
+            if format_mac(address) in current_addresses:
                 continue
             if _is_specialized_service_info(info):
-                self._discovered_devices[info.address] = info
+                discovered[address] = info.name or "Specialized Turbo"
+                self._discovered_version += 1
 
         if not self._discovered_devices:
             return self.async_abort(reason="no_devices_found")
 
-        address_options = {
-            addr: f"{info.name or 'Specialized Turbo'} ({addr})"
-            for addr, info in self._discovered_devices.items()
-        }
-
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_ADDRESS): vol.In(address_options),
-                    vol.Optional(CONF_PIN): str,
-                }
-            ),
+            data_schema=self._async_user_schema(),
             errors=errors,
         )
 
+    def _async_user_schema(self) -> vol.Schema:
+        """Return the user step schema, rebuilding it only when devices change."""
+        if (
+            self._user_schema is not None
+            and self._user_schema_version == self._discovered_version
+        ):
+            return self._user_schema
+
+        address_options = [
+            SelectOptionDict(value=addr, label=f"{name} ({addr})")
+            for addr, name in self._discovered_devices.items()
+        ]
+        self._user_schema = vol.Schema(
+            {
+                vol.Required(CONF_ADDRESS): SelectSelector(
+                    SelectSelectorConfig(options=address_options)
+                ),
+                **_PIN_SCHEMA.schema,
+            }
+        )
+        self._user_schema_version = self._discovered_version
+        return self._user_schema
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -155,14 +227,26 @@ class SpecializedTurboConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reconfigure",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(CONF_PIN): str,
-                }
-            ),
+            data_schema=_PIN_SCHEMA,
         )
 
 
 def _is_specialized_service_info(info: BluetoothServiceInfoBleak) -> bool:
     """Check if a BluetoothServiceInfoBleak is a Specialized bike."""
-    return bool(is_specialized_advertisement(info.manufacturer_data))
+    manufacturer_data = info.manufacturer_data
+    # Most nearby devices never use one of our company IDs; skip them cheaply
+    if _lacks_specialized_company_id(manufacturer_data):
+        return False
+    return _is_specialized_manufacturer_data(frozenset(manufacturer_data.items()))
+
+
+@lru_cache(maxsize=256)
+def _is_specialized_manufacturer_data(
+    manufacturer_data: frozenset[tuple[int, bytes]],
+) -> bool:
+    """Check manufacturer data, caching the verdict per unique advertisement.
+
+    The user step re-scans every discovered device on each form render, so
+    the same advertisements are checked over and over.
+    """
+    return is_specialized_advertisement(dict(manufacturer_data))
@@ -1,5 +1,14 @@
 """Constants for the Specialized Turbo integration."""
 
+from typing import Final
+
+from specialized_turbo import APPLE_COMPANY_ID, NORDIC_COMPANY_ID, SIMPLO_COMPANY_ID
+
 DOMAIN = "specialized_turbo"
 
 CONF_PIN = "pin"
+
+# Bluetooth SIG company IDs a Specialized bike can advertise under
+SPECIALIZED_COMPANY_IDS: Final = frozenset(
+    {NORDIC_COMPANY_ID, APPLE_COMPANY_ID, SIMPLO_COMPANY_ID}
+)
@@ -11,23 +11,29 @@ fields periodically.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from dataclasses import fields
 import logging
+import random
 import time
+from typing import Any
 
 from bleak import BleakClient, BleakError
 from bleak.backends.characteristic import BleakGATTCharacteristic
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.components.bluetooth.active_update_coordinator import (
     ActiveBluetoothDataUpdateCoordinator,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
 
 from specialized_turbo import (
     CHAR_NOTIFY,
     TCU1_POLL_FIELDS,
     BLEProfile,
+    ParsedMessage,
     TelemetrySnapshot,
     build_request,
     build_tcx_request,
@@ -43,11 +49,31 @@ from specialized_turbo.parameters import BikeParameter
 from specialized_turbo.framing import is_framed_packet, strip_clear_prefix, unpack_tcx
 from specialized_turbo.session import TCU1Session, TCXSession, ProtocolSession
 
+from .const import DOMAIN
+
 _LOGGER = logging.getLogger(__name__)
 
 # How often to re-poll TCU1 fields (seconds)
 _TCU1_POLL_INTERVAL = 60
 
+# Window for coalescing notification-driven entity updates (seconds)
+_UPDATE_DEBOUNCE = 0.2
+
+# Maximum number of raw notifications buffered before the oldest is dropped
+_RX_QUEUE_SIZE = 64
+
+# Bounds for the exponential backoff between failed connection attempts (seconds)
+_RECONNECT_BACKOFF_MIN = 1.0
+_RECONNECT_BACKOFF_MAX = 300.0
+
+# How long a connection stays open after unload so a reload can reuse it
+_DISCONNECT_GRACE = 30
+
+# Shut-down coordinators still holding a warm connection, keyed by address
+_PARKED_COORDINATORS: HassKey[dict[str, SpecializedTurboCoordinator]] = HassKey(
+    f"{DOMAIN}_parked_coordinators"
+)
+
 _TCX_POLL_PARAMS: tuple[BikeParameter, ...] = (
     BikeParameter.SYSTEM_STATE,
     BikeParameter.SYSTEM_RANGE_LONG,
@@ -66,9 +92,41 @@ _TCX_POLL_PARAMS: tuple[BikeParameter, ...] = (
 )
 
 
+def _as_dict(obj: Any) -> dict[str, Any]:
+    """Return a shallow field dict; the state models only hold scalars."""
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+
 class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
     """Manages the BLE connection and notification subscription for one bike."""
 
+    # The HA base class keeps a __dict__, so these mainly speed up access to
+    # the attributes read on every notification.
+    __slots__ = (
+        "_address",
+        "_char_request_read",
+        "_char_request_write",
+        "_client",
+        "_diag_cache",
+        "_disconnect_handle",
+        "_disconnect_owner",
+        "_flush_handle",
+        "_generation",
+        "_last_poll_time",
+        "_last_values",
+        "_next_connect_time",
+        "_pin",
+        "_reconnect_backoff",
+        "_rx",
+        "_rx_task",
+        "_rx_wake",
+        "_session",
+        "_successor",
+        "_uses_tcx_messages",
+        "_was_unavailable",
+        "snapshot",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -100,6 +158,23 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         # True once we've seen a CRC-framed (TCX) notification.
         # Some bikes advertise TCX UUIDs but send TCU1-format messages.
         self._uses_tcx_messages: bool | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Single producer (BLE callback) and single consumer (RX worker), so a
+        # bounded deque plus a wake-up event is enough; overflow drops the oldest.
+        self._rx: deque[bytes] = deque(maxlen=_RX_QUEUE_SIZE)
+        self._rx_wake = asyncio.Event()
+        self._rx_task: asyncio.Task[None] | None = None
+        self._reconnect_backoff = _RECONNECT_BACKOFF_MIN
+        self._next_connect_time: float = 0
+        self._disconnect_handle: asyncio.TimerHandle | None = None
+        # Newest coordinator using the connection we opened, after a reload
+        self._successor: SpecializedTurboCoordinator | None = None
+        # Coordinator whose Bleak disconnect callback our adopted client calls
+        self._disconnect_owner: SpecializedTurboCoordinator | None = None
+        # Last value pushed per (sender, channel, field), to skip no-op updates
+        self._last_values: dict[tuple[int, int, str | None], float | None] = {}
+        # (message_count, snapshot dict) last built for diagnostics
+        self._diag_cache: tuple[int, dict[str, Any]] | None = None
 
     @callback
     def _needs_poll(
@@ -114,7 +189,9 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             if gen is not None:
                 self._generation = gen
         if self._client is None or not self._client.is_connected:
-            return True
+            # Hold off while backing off after a failed connection, so an
+            # out-of-range bike doesn't trigger a reconnect per advertisement.
+            return time.monotonic() >= self._next_connect_time
         # Periodically re-poll fields via request-read.  Skip until the
         # first poll interval has elapsed after connection.
         if self._last_poll_time == 0:
@@ -130,6 +207,15 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             await self._ensure_connected(service_info)
         except BleakError:
             self._client = None
+            # _needs_poll skips polls until this time has passed
+            self._next_connect_time = (
+                time.monotonic()
+                + self._reconnect_backoff
+                + random.uniform(0, self._reconnect_backoff * 0.1)
+            )
+            self._reconnect_backoff = min(
+                self._reconnect_backoff * 2, _RECONNECT_BACKOFF_MAX
+            )
             raise
 
         # Poll fields via request-read.  Use the message format detected
@@ -152,6 +238,13 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         if self._client and self._client.is_connected:
             return
 
+        client = self._async_adopt_parked_client()
+        if client is not None:
+            _LOGGER.debug("Reusing connection to %s after reload", self._address)
+            self._client = client
+            await self._async_setup_client(client)
+            return
+
         _LOGGER.debug("Connecting to Specialized Turbo at %s", self._address)
 
         ble_device = (
@@ -169,13 +262,18 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             return
 
         client = await establish_connection(
-            BleakClient,
+            BleakClientWithServiceCache,
             ble_device,
             self._address,
             disconnected_callback=self._on_disconnect,
         )
         self._client = client
+        await self._async_setup_client(client)
 
+    async def _async_setup_client(self, client: BleakClient) -> None:
+        """Set up the protocol session and subscribe on a connected client."""
+        # Force the first notification after (re)connecting to reach HA
+        self._last_values.clear()
         if self._was_unavailable:
             _LOGGER.info("Specialized Turbo at %s is available again", self._address)
             self._was_unavailable = False
@@ -213,25 +311,56 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             await self._identify_tcx()
 
         # Subscribe to telemetry notifications
+        if self._rx_task is None or self._rx_task.done():
+            self._rx_task = self.hass.async_create_background_task(
+                self._rx_worker(), f"specialized_turbo rx {self._address}"
+            )
+        # Subscribe by UUID: BleakClientWithServiceCache has already resolved
+        # the services, so a cached handle would only go stale after a
+        # firmware update without saving a GATT round-trip.
         await client.start_notify(char_notify, self._notification_handler)
         _LOGGER.info("Subscribed to telemetry notifications")
+        self._reconnect_backoff = _RECONNECT_BACKOFF_MIN
+        self._next_connect_time = 0
 
     def _notification_handler(
         self, sender: BleakGATTCharacteristic | int, data: bytearray
     ) -> None:
         """Handle a BLE notification (called from Bleak's BLE thread)."""
-        self.hass.loop.call_soon_threadsafe(self._handle_notification, bytes(data))
+        self.hass.loop.call_soon_threadsafe(self._enqueue_notification, bytes(data))
+
+    @callback
+    def _enqueue_notification(self, data: bytes) -> None:
+        """Buffer a raw notification for the RX worker, dropping the oldest."""
+        self._rx.append(data)
+        self._rx_wake.set()
+
+    async def _rx_worker(self) -> None:
+        """Parse buffered notifications, decoupled from the BLE callback."""
+        rx = self._rx
+        while True:
+            await self._rx_wake.wait()
+            self._rx_wake.clear()
+            while rx:
+                # One bad frame must not stop the worker and the telemetry
+                try:
+                    self._handle_notification(rx.popleft())
+                except Exception:
+                    _LOGGER.exception("Error handling notification")
 
     @callback
     def _handle_notification(self, data: bytes) -> None:
         """Parse a BLE notification and push the update to HA."""
-        _LOGGER.debug(
-            "notify raw (%d bytes, gen=%s, session=%s): %s",
-            len(data),
-            self._generation,
-            type(self._session).__name__,
-            data.hex(),
-        )
+        # Avoid building hex dumps per notification unless debug is on
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "notify raw (%d bytes, gen=%s, session=%s): %s",
+                len(data),
+                self._generation,
+                type(self._session).__name__,
+                data.hex(),
+            )
 
         # Auto-detect message format from the data itself.
         # CRC-framed 20-byte packets → TCX parameter ID format.
@@ -252,19 +381,54 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
             else:
                 msg = parse_message(data)
         except Exception:
-            _LOGGER.debug("Failed to parse notification: %s", data.hex(), exc_info=True)
+            if debug:
+                _LOGGER.debug(
+                    "Failed to parse notification: %s", data.hex(), exc_info=True
+                )
             return
 
-        _LOGGER.debug(
-            "parsed: name=%s raw=%s converted=%s unit=%s",
-            msg.field_name,
-            msg.raw_value,
-            msg.converted_value,
-            msg.unit,
-        )
+        if debug:
+            _LOGGER.debug(
+                "parsed: name=%s raw=%s converted=%s unit=%s",
+                msg.field_name,
+                msg.raw_value,
+                msg.converted_value,
+                msg.unit,
+            )
         self.snapshot.update_from_message(msg)
 
-        # Push the update to HA — this triggers entity state writes
+        # An idle bike keeps repeating the same values; only push changes.
+        if not self._remember_value(msg):
+            return
+
+        # Bikes stream several fields per second; batch them into a single
+        # push to HA per debounce window rather than one per notification.
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                _UPDATE_DEBOUNCE, self._async_flush_update
+            )
+
+    @callback
+    def _remember_value(self, msg: ParsedMessage) -> bool:
+        """Record the latest value of a field; return False if it is unchanged.
+
+        Polls record their values too, so a notification that restores a
+        value overwritten by a poll is not mistaken for a repeat.
+        """
+        key = (msg.sender, msg.channel, msg.field_name)
+        value = msg.converted_value
+        last_values = self._last_values
+        if key in last_values and last_values[key] == value:
+            return False
+        last_values[key] = value
+        return True
+
+    @callback
+    def _async_flush_update(self) -> None:
+        """Push pending notification updates to HA."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         self.async_update_listeners()
 
     async def _poll_tcu1_fields(self) -> None:
@@ -295,6 +459,7 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
                         msg.converted_value,
                     )
                     self.snapshot.update_from_message(msg)
+                    self._remember_value(msg)
                     updated = True
             except Exception:
                 _LOGGER.debug(
@@ -323,8 +488,9 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
                 unpacked = self._session.unpack(response)
                 msg = parse_tcx_message(unpacked)
                 self.snapshot.update_from_message(msg)
+                self._remember_value(msg)
                 updated = True
-                if msg.field_name:
+                if msg.field_name and _LOGGER.isEnabledFor(logging.DEBUG):
                     _LOGGER.debug(
                         "tcx poll %s = %s %s",
                         msg.field_name,
@@ -423,6 +589,24 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         """Return True if the BLE client is connected."""
         return self._client is not None and self._client.is_connected
 
+    @callback
+    def async_diagnostics_snapshot(self) -> dict[str, Any]:
+        """Return the snapshot as a dict, rebuilt only after new messages."""
+        snapshot = self.snapshot
+        # Every update bumps message_count, so it doubles as a cache key
+        cache = self._diag_cache
+        if cache is not None and cache[0] == snapshot.message_count:
+            return cache[1]
+        data = {
+            "message_count": snapshot.message_count,
+            "battery": _as_dict(snapshot.battery),
+            "motor": _as_dict(snapshot.motor),
+            "settings": _as_dict(snapshot.settings),
+            "system": _as_dict(snapshot.system),
+        }
+        self._diag_cache = (snapshot.message_count, data)
+        return data
+
     def _on_disconnect(self, client: BleakClient) -> None:
         """Handle unexpected disconnection (called from Bleak's BLE thread)."""
         self.hass.loop.call_soon_threadsafe(self._handle_disconnect)
@@ -430,6 +614,20 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
     @callback
     def _handle_disconnect(self) -> None:
         """Process disconnection on the HA event loop."""
+        # The Bleak disconnect callback stays bound to the coordinator that
+        # opened the connection, so forward it after a handover.
+        if (successor := self._successor) is not None:
+            self._successor = None
+            successor._disconnect_owner = None
+            successor._handle_disconnect()
+            return
+        if self._disconnect_handle is not None:
+            # A parked connection dropped on its own; nothing left to reuse
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+            parked = self.hass.data.get(_PARKED_COORDINATORS)
+            if parked is not None and parked.get(self._address) is self:
+                del parked[self._address]
         if not self._was_unavailable:
             _LOGGER.info("Disconnected from Specialized Turbo at %s", self._address)
             self._was_unavailable = True
@@ -437,7 +635,13 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
         self.async_update_listeners()
 
     async def async_shutdown(self) -> None:
-        """Clean up BLE connection on unload."""
+        """Stop notifications on unload and park the connection for reuse."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._rx_task is not None:
+            self._rx_task.cancel()
+            self._rx_task = None
         if self._client and self._client.is_connected:
             char_notify = (
                 get_char_notify(self._generation)
@@ -448,8 +652,52 @@ class SpecializedTurboCoordinator(ActiveBluetoothDataUpdateCoordinator[None]):
                 await self._client.stop_notify(char_notify)
             except Exception:
                 _LOGGER.debug("Error stopping notifications", exc_info=True)
-            try:
-                await self._client.disconnect()
-            except Exception:
-                _LOGGER.debug("Error disconnecting", exc_info=True)
+            # Keep the link up briefly so a reload (e.g. after reconfigure)
+            # can skip a full reconnect and service discovery.
+            self._disconnect_handle = self.hass.loop.call_later(
+                _DISCONNECT_GRACE, self._async_deferred_disconnect
+            )
+            self.hass.data.setdefault(_PARKED_COORDINATORS, {})[self._address] = self
+            return
         self._client = None
+
+    @callback
+    def _async_adopt_parked_client(self) -> BleakClient | None:
+        """Take over a warm connection left by a previous coordinator."""
+        parked = self.hass.data.get(_PARKED_COORDINATORS)
+        if not parked or (previous := parked.pop(self._address, None)) is None:
+            return None
+        if previous._disconnect_handle is not None:
+            previous._disconnect_handle.cancel()
+            previous._disconnect_handle = None
+        client, previous._client = previous._client, None
+        if client is None or not client.is_connected:
+            return None
+        # Point the coordinator that owns the Bleak callback straight at us,
+        # so repeated reloads never build up a forwarding chain.
+        owner = previous._disconnect_owner or previous
+        previous._successor = previous._disconnect_owner = None
+        owner._successor = self
+        self._disconnect_owner = owner
+        return client
+
+    @callback
+    def _async_deferred_disconnect(self) -> None:
+        """Disconnect a parked connection nobody reused."""
+        self._disconnect_handle = None
+        parked = self.hass.data.get(_PARKED_COORDINATORS)
+        if parked is not None and parked.get(self._address) is self:
+            del parked[self._address]
+        self.hass.async_create_background_task(
+            self._async_disconnect(), f"specialized_turbo disconnect {self._address}"
+        )
+
+    async def _async_disconnect(self) -> None:
+        """Disconnect the BLE client, if any."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            await client.disconnect()
+        except Exception:
+            _LOGGER.debug("Error disconnecting", exc_info=True)
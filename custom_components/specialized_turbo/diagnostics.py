@@ -2,33 +2,29 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED
 from homeassistant.core import HomeAssistant
 
 from . import SpecializedTurboConfigEntry
 from .const import CONF_PIN
 
-TO_REDACT = {CONF_PIN}
-
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant,
     entry: SpecializedTurboConfigEntry,
 ) -> dict[str, Any]:
     """Return diagnostics for a config entry."""
-    coordinator = entry.runtime_data
-    snapshot = coordinator.snapshot
+    snapshot_data = entry.runtime_data.async_diagnostics_snapshot()
+
+    # The PIN is the only secret and always lives directly under "data"
+    entry_data = entry.as_dict()
+    data = entry_data["data"]
+    if data.get(CONF_PIN) is not None:
+        entry_data["data"] = {**data, CONF_PIN: REDACTED}
 
     return {
-        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
-        "snapshot": {
-            "message_count": snapshot.message_count,
-            "battery": asdict(snapshot.battery),
-            "motor": asdict(snapshot.motor),
-            "settings": asdict(snapshot.settings),
-            "system": asdict(snapshot.system),
-        },
+        "entry": entry_data,
+        "snapshot": snapshot_data,
     }
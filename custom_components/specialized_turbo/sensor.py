@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -46,6 +47,10 @@ PARALLEL_UPDATES = 0
 class SpecializedSensorEntityDescription(SensorEntityDescription):
     """Describes a Specialized Turbo sensor entity."""
 
+    # Explicit slot rather than slots=True, which would rebuild the class
+    # outside HA's FrozenOrThawed entity-description metaclass.
+    __slots__ = ("value_fn",)
+
     value_fn: Callable[[TelemetrySnapshot], StateType]
 
 
@@ -67,7 +72,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.battery.charge_pct,
+        value_fn=attrgetter("battery.charge_pct"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_capacity_wh",
@@ -75,7 +80,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY_STORAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.battery.capacity_wh,
+        value_fn=attrgetter("battery.capacity_wh"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_remaining_wh",
@@ -83,7 +88,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfEnergy.WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY_STORAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.battery.remaining_wh,
+        value_fn=attrgetter("battery.remaining_wh"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_health",
@@ -91,7 +96,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.battery.health_pct,
+        value_fn=attrgetter("battery.health_pct"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_temp",
@@ -100,14 +105,14 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.battery.temp_c,
+        value_fn=attrgetter("battery.temp_c"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_charge_cycles",
         translation_key="battery_charge_cycles",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.battery.charge_cycles,
+        value_fn=attrgetter("battery.charge_cycles"),
     ),
     SpecializedSensorEntityDescription(
         key="battery_voltage",
@@ -116,7 +121,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.battery.voltage_v,
+        value_fn=attrgetter("battery.voltage_v"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -126,7 +131,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CURRENT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.battery.current_a,
+        value_fn=attrgetter("battery.current_a"),
         suggested_display_precision=1,
     ),
     # --- Motor / Rider ---
@@ -136,7 +141,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
         device_class=SensorDeviceClass.SPEED,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.motor.speed_kmh,
+        value_fn=attrgetter("motor.speed_kmh"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -145,7 +150,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.motor.rider_power_w,
+        value_fn=attrgetter("motor.rider_power_w"),
     ),
     SpecializedSensorEntityDescription(
         key="motor_power",
@@ -153,14 +158,14 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfPower.WATT,
         device_class=SensorDeviceClass.POWER,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.motor.motor_power_w,
+        value_fn=attrgetter("motor.motor_power_w"),
     ),
     SpecializedSensorEntityDescription(
         key="cadence",
         translation_key="cadence",
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=lambda s: s.motor.cadence_rpm,
+        value_fn=attrgetter("motor.cadence_rpm"),
         suggested_display_precision=0,
     ),
     SpecializedSensorEntityDescription(
@@ -169,7 +174,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.KILOMETERS,
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.TOTAL_INCREASING,
-        value_fn=lambda s: s.motor.odometer_km,
+        value_fn=attrgetter("motor.odometer_km"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -179,7 +184,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.motor.motor_temp_c,
+        value_fn=attrgetter("motor.motor_temp_c"),
     ),
     SpecializedSensorEntityDescription(
         key="assist_level",
@@ -195,7 +200,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.settings.assist_lev1_pct,
+        value_fn=attrgetter("settings.assist_lev1_pct"),
     ),
     SpecializedSensorEntityDescription(
         key="assist_trail_pct",
@@ -203,7 +208,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.settings.assist_lev2_pct,
+        value_fn=attrgetter("settings.assist_lev2_pct"),
     ),
     SpecializedSensorEntityDescription(
         key="assist_turbo_pct",
@@ -211,7 +216,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.settings.assist_lev3_pct,
+        value_fn=attrgetter("settings.assist_lev3_pct"),
     ),
     # --- System (TCX2+ only, disabled by default) ---
     SpecializedSensorEntityDescription(
@@ -221,7 +226,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.range_long_km,
+        value_fn=attrgetter("system.range_long_km"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -231,7 +236,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DISTANCE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.range_short_km,
+        value_fn=attrgetter("system.range_short_km"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -240,7 +245,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.METERS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.altitude_m,
+        value_fn=attrgetter("system.altitude_m"),
     ),
     SpecializedSensorEntityDescription(
         key="altitude_gain",
@@ -248,7 +253,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfLength.METERS,
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.altitude_gain_m,
+        value_fn=attrgetter("system.altitude_gain_m"),
     ),
     SpecializedSensorEntityDescription(
         key="gradient",
@@ -256,7 +261,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.gradient_pct,
+        value_fn=attrgetter("system.gradient_pct"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -267,7 +272,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda s: s.system.system_temp_c,
+        value_fn=attrgetter("system.system_temp_c"),
     ),
     SpecializedSensorEntityDescription(
         key="consumption",
@@ -275,7 +280,7 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement="Wh/km",
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.consumption_wh_km,
+        value_fn=attrgetter("system.consumption_wh_km"),
         suggested_display_precision=1,
     ),
     SpecializedSensorEntityDescription(
@@ -284,10 +289,15 @@ SENSOR_DESCRIPTIONS: tuple[SpecializedSensorEntityDescription, ...] = (
         native_unit_of_measurement="kcal",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_registry_enabled_default=False,
-        value_fn=lambda s: s.system.kcal,
+        value_fn=attrgetter("system.kcal"),
     ),
 )
 
+# Unique ID suffix per description key, built once at import
+_UNIQUE_ID_SUFFIXES: dict[str, str] = {
+    description.key: f"_{description.key}" for description in SENSOR_DESCRIPTIONS
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -296,12 +306,25 @@ async def async_setup_entry(
 ) -> None:
     """Set up Specialized Turbo sensors from a config entry."""
     coordinator = entry.runtime_data
+    address = entry.data[CONF_ADDRESS]
+    mac = format_mac(address)
+    # Every sensor belongs to the same bike, so share one DeviceInfo
+    device_info = DeviceInfo(
+        connections={(CONNECTION_BLUETOOTH, address)},
+        name=entry.title,
+        manufacturer="Specialized",
+        model="Turbo",
+    )
 
-    entities = [
-        SpecializedTurboSensor(coordinator, description, entry)
-        for description in SENSOR_DESCRIPTIONS
-    ]
-    async_add_entities(entities)
+    # Values come straight from the coordinator's snapshot, which exists from
+    # construction, so there is nothing to fetch before the entities are added
+    async_add_entities(
+        (
+            SpecializedTurboSensor(coordinator, description, mac, device_info)
+            for description in SENSOR_DESCRIPTIONS
+        ),
+        update_before_add=False,
+    )
 
 
 class SpecializedTurboSensor(
@@ -317,29 +340,28 @@ class SpecializedTurboSensor(
         self,
         coordinator: SpecializedTurboCoordinator,
         description: SpecializedSensorEntityDescription,
-        entry: SpecializedTurboConfigEntry,
+        mac: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = (
-            f"{format_mac(entry.data[CONF_ADDRESS])}_{description.key}"
-        )
-        self._attr_device_info = DeviceInfo(
-            connections={(CONNECTION_BLUETOOTH, entry.data[CONF_ADDRESS])},
-            name=entry.title,
-            manufacturer="Specialized",
-            model="Turbo",
-        )
+        self._value_fn = description.value_fn
+        self._attr_unique_id = mac + _UNIQUE_ID_SUFFIXES[description.key]
+        self._attr_device_info = device_info
+        # message_count never decreases, so once data has arrived it stays true
+        self._has_data = False
 
     @property
     def available(self) -> bool:
         """Return True when the bike is connected and has sent data."""
-        return (
-            self.coordinator.connected and self.coordinator.snapshot.message_count > 0
-        )
+        if not self.coordinator.connected:
+            return False
+        if not self._has_data:
+            self._has_data = self.coordinator.snapshot.message_count > 0
+        return self._has_data
 
     @property
     def native_value(self) -> StateType:
         """Return the sensor value from the coordinator's snapshot."""
-        return self.entity_description.value_fn(self.coordinator.snapshot)
+        return self._value_fn(self.coordinator.snapshot)
@@ -0,0 +1,79 @@
+"""Shared constants and helpers for Specialized Turbo integration tests."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+
+from homeassistant.const import CONF_ADDRESS
+
+from custom_components.specialized_turbo.const import CONF_PIN
+
+MOCK_ADDRESS = "DC:DD:BB:4A:D6:55"
+MOCK_ADDRESS_FORMATTED = "dc:dd:bb:4a:d6:55"
+MOCK_NAME = "SPECIALIZED"
+MOCK_MANUFACTURER_DATA: dict[int, bytes] = {0x0059: b"TURBOHMItest1234"}
+
+# Read-only config entry payloads, shared instead of rebuilt per test
+MOCK_ENTRY_DATA = MappingProxyType({CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234})
+MOCK_ENTRY_DATA_NO_PIN = MappingProxyType({CONF_ADDRESS: MOCK_ADDRESS})
+
+# TCU1 (2018 Levo) test data
+MOCK_GEN1_ADDRESS = "C6:1A:10:12:5E:48"
+MOCK_GEN1_ADDRESS_FORMATTED = "c6:1a:10:12:5e:48"
+MOCK_GEN1_NAME = "SPECIALIZED"
+MOCK_GEN1_MANUFACTURER_DATA: dict[int, bytes] = {
+    0x020D: bytes.fromhex("028657" + "ff" * 24),
+}
+
+
+class FakeServiceInfo:
+    """Minimal stand-in for BluetoothServiceInfoBleak."""
+
+    __slots__ = ("address", "manufacturer_data", "name", "time")
+
+    def __init__(
+        self,
+        name: str,
+        address: str,
+        manufacturer_data: dict[int, bytes],
+        time: float = 0.0,
+    ) -> None:
+        """Store the fields the integration reads."""
+        self.name = name
+        self.address = address
+        self.manufacturer_data = manufacturer_data
+        self.time = time
+
+
+def make_service_info(
+    name: str = MOCK_NAME,
+    address: str = MOCK_ADDRESS,
+    manufacturer_data: dict[int, bytes] | None = None,
+) -> FakeServiceInfo:
+    """Create a stand-in BluetoothServiceInfoBleak."""
+    return FakeServiceInfo(
+        name=name,
+        address=address,
+        manufacturer_data=(
+            manufacturer_data
+            if manufacturer_data is not None
+            else MOCK_MANUFACTURER_DATA
+        ),
+    )
+
+
+def make_tcu1_service_info(
+    name: str = MOCK_GEN1_NAME,
+    address: str = MOCK_GEN1_ADDRESS,
+    manufacturer_data: dict[int, bytes] | None = None,
+) -> FakeServiceInfo:
+    """Create a stand-in BluetoothServiceInfoBleak for a TCU1 bike."""
+    return FakeServiceInfo(
+        name=name,
+        address=address,
+        manufacturer_data=(
+            manufacturer_data
+            if manufacturer_data is not None
+            else MOCK_GEN1_MANUFACTURER_DATA
+        ),
+    )
@@ -4,71 +4,56 @@ from __future__ import annotations
 
 import asyncio
 import sys
-from unittest.mock import MagicMock
 
 import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.specialized_turbo.const import DOMAIN
+
+from .common import MOCK_ADDRESS_FORMATTED, MOCK_ENTRY_DATA
 
 # Windows requires SelectorEventLoop for compatibility with pytest-homeassistant
-if sys.platform == "win32":
+if sys.platform == "win32" and not isinstance(
+    asyncio.get_event_loop_policy(), asyncio.WindowsSelectorEventLoopPolicy
+):
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
 
-@pytest.fixture(autouse=True)
-def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:  # noqa: PT004
-    """Enable custom integrations in all tests."""
-    return
+def _needs_hass(request: pytest.FixtureRequest) -> bool:
+    """Return False for sensor_pure tests, which run without Home Assistant."""
+    return request.node.get_closest_marker("sensor_pure") is None
 
 
 @pytest.fixture(autouse=True)
-def mock_bluetooth(  # noqa: PT004
-    mock_bleak_scanner_start: MagicMock,
-    mock_bluetooth_adapters: None,
-) -> None:
-    """Mock out bluetooth from starting."""
-    return
-
-
-MOCK_ADDRESS = "DC:DD:BB:4A:D6:55"
-MOCK_ADDRESS_FORMATTED = "dc:dd:bb:4a:d6:55"
-MOCK_NAME = "SPECIALIZED"
-MOCK_MANUFACTURER_DATA: dict[int, bytes] = {0x0059: b"TURBOHMItest1234"}
+def auto_enable_custom_integrations(request: pytest.FixtureRequest) -> None:  # noqa: PT004
+    """Enable custom integrations in all tests that use Home Assistant."""
+    # Requested lazily: enable_custom_integrations builds a full hass instance
+    if _needs_hass(request):
+        request.getfixturevalue("enable_custom_integrations")
 
-# TCU1 (2018 Levo) test data
-MOCK_GEN1_ADDRESS = "C6:1A:10:12:5E:48"
-MOCK_GEN1_ADDRESS_FORMATTED = "c6:1a:10:12:5e:48"
-MOCK_GEN1_NAME = "SPECIALIZED"
-MOCK_GEN1_MANUFACTURER_DATA: dict[int, bytes] = {
-    0x020D: bytes.fromhex("028657" + "ff" * 24),
-}
 
-
-def make_service_info(
-    name: str = MOCK_NAME,
-    address: str = MOCK_ADDRESS,
-    manufacturer_data: dict[int, bytes] | None = None,
-) -> MagicMock:
-    """Create a mock BluetoothServiceInfoBleak."""
-    info = MagicMock()
-    info.name = name
-    info.address = address
-    info.manufacturer_data = (
-        manufacturer_data if manufacturer_data is not None else MOCK_MANUFACTURER_DATA
-    )
-    return info
-
-
-def make_tcu1_service_info(
-    name: str = MOCK_GEN1_NAME,
-    address: str = MOCK_GEN1_ADDRESS,
-    manufacturer_data: dict[int, bytes] | None = None,
-) -> MagicMock:
-    """Create a mock BluetoothServiceInfoBleak for a TCU1 bike."""
-    info = MagicMock()
-    info.name = name
-    info.address = address
-    info.manufacturer_data = (
-        manufacturer_data
-        if manufacturer_data is not None
-        else MOCK_GEN1_MANUFACTURER_DATA
+@pytest.fixture(autouse=True)
+def mock_bluetooth(request: pytest.FixtureRequest) -> None:  # noqa: PT004
+    """Mock out bluetooth from starting."""
+    if _needs_hass(request):
+        request.getfixturevalue("mock_bleak_scanner_start")
+        request.getfixturevalue("mock_bluetooth_adapters")
+
+
+@pytest.fixture
+def config_entry(
+    hass: HomeAssistant, request: pytest.FixtureRequest
+) -> MockConfigEntry:
+    """Add a config entry for the mock bike.
+
+    Parametrize indirectly with an entry data mapping to override the
+    default payload (which includes a PIN).
+    """
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=getattr(request, "param", MOCK_ENTRY_DATA),
+        unique_id=MOCK_ADDRESS_FORMATTED,
     )
-    return info
+    entry.add_to_hass(hass)
+    return entry
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from bleak import BleakError
@@ -11,9 +13,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.specialized_turbo.config_flow import (
+    _DISCOVERY_DEDUP_WINDOW,
+    _RECENT_DISCOVERIES,
+    _is_specialized_manufacturer_data,
+    _is_specialized_service_info,
+)
 from custom_components.specialized_turbo.const import CONF_PIN, DOMAIN
 
-from .conftest import (
+from .common import (
     MOCK_ADDRESS,
     MOCK_ADDRESS_FORMATTED,
     MOCK_GEN1_ADDRESS,
@@ -33,65 +41,46 @@ def mock_setup_entry():
         yield
 
 
-def _mock_connection_success():
-    """Return context managers for a successful BLE connection test."""
-    mock_client = MagicMock()
-    mock_client.disconnect = AsyncMock()
-    return (
-        patch(
-            "custom_components.specialized_turbo.config_flow.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.config_flow.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    )
-
+_BLE_DEVICE_FROM_ADDRESS = (
+    "custom_components.specialized_turbo.config_flow.async_ble_device_from_address"
+)
+_ESTABLISH_CONNECTION = (
+    "custom_components.specialized_turbo.config_flow.establish_connection"
+)
 
-def _mock_connection_failure_no_device():
-    """Return context managers for a failed BLE connection (device not found)."""
-    return (
-        patch(
-            "custom_components.specialized_turbo.config_flow.async_ble_device_from_address",
-            return_value=None,
-        ),
-        patch(
-            "custom_components.specialized_turbo.config_flow.establish_connection",
-            new_callable=AsyncMock,
-        ),
-    )
+# The flow only passes the device through and disconnects the client
+_FAKE_BLE_DEVICE = object()
+_FAKE_CLIENT = SimpleNamespace(disconnect=AsyncMock())
 
 
-def _mock_connection_failure_bleak_error():
-    """Return context managers for a failed BLE connection (BleakError)."""
+def _mock_connection(*, device_found: bool = True, side_effect=None):
+    """Return context managers for the BLE connection test."""
     return (
         patch(
-            "custom_components.specialized_turbo.config_flow.async_ble_device_from_address",
-            return_value=MagicMock(),
+            _BLE_DEVICE_FROM_ADDRESS,
+            return_value=_FAKE_BLE_DEVICE if device_found else None,
         ),
         patch(
-            "custom_components.specialized_turbo.config_flow.establish_connection",
+            _ESTABLISH_CONNECTION,
             new_callable=AsyncMock,
-            side_effect=BleakError("Connection failed"),
+            return_value=_FAKE_CLIENT,
+            side_effect=side_effect,
         ),
     )
 
 
-def _mock_connection_failure_timeout():
-    """Return context managers for a failed BLE connection (TimeoutError)."""
-    return (
-        patch(
-            "custom_components.specialized_turbo.config_flow.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.config_flow.establish_connection",
-            new_callable=AsyncMock,
-            side_effect=TimeoutError,
-        ),
-    )
+@pytest.fixture(
+    params=[
+        pytest.param({"device_found": False}, id="no_device"),
+        pytest.param({"side_effect": BleakError("Connection failed")}, id="bleak"),
+        pytest.param({"side_effect": TimeoutError}, id="timeout"),
+    ]
+)
+def connection_failure(request: pytest.FixtureRequest):
+    """Make the BLE connection test fail in each supported way."""
+    p1, p2 = _mock_connection(**request.param)
+    with p1, p2:
+        yield
 
 
 # --- Bluetooth Discovery ---
@@ -109,7 +98,7 @@ async def test_bluetooth_discovery(hass: HomeAssistant) -> None:
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "bluetooth_confirm"
 
-    p1, p2 = _mock_connection_success()
+    p1, p2 = _mock_connection()
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -132,7 +121,7 @@ async def test_bluetooth_discovery_no_pin(hass: HomeAssistant) -> None:
         data=service_info,
     )
 
-    p1, p2 = _mock_connection_success()
+    p1, p2 = _mock_connection()
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -161,12 +150,12 @@ async def test_bluetooth_discovery_already_configured(hass: HomeAssistant) -> No
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "already_configured"
+    # Configured bikes are not tracked in the dedupe table
+    assert not hass.data[_RECENT_DISCOVERIES]
 
 
-async def test_bluetooth_confirm_cannot_connect_no_device(
-    hass: HomeAssistant,
-) -> None:
-    """Test bluetooth confirm shows error when device is not found."""
+async def test_bluetooth_discovery_duplicate_aborts(hass: HomeAssistant) -> None:
+    """Test a repeat discovery of the same bike within the window aborts."""
     service_info = make_service_info()
 
     result = await hass.config_entries.flow.async_init(
@@ -174,45 +163,34 @@ async def test_bluetooth_confirm_cannot_connect_no_device(
         context={"source": config_entries.SOURCE_BLUETOOTH},
         data=service_info,
     )
-
-    p1, p2 = _mock_connection_failure_no_device()
-    with p1, p2:
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_PIN: "1234"},
-        )
-
     assert result["type"] is FlowResultType.FORM
-    assert result["errors"] == {"base": "cannot_connect"}
-
-
-async def test_bluetooth_confirm_cannot_connect_bleak_error(
-    hass: HomeAssistant,
-) -> None:
-    """Test bluetooth confirm shows error on BleakError."""
-    service_info = make_service_info()
 
     result = await hass.config_entries.flow.async_init(
         DOMAIN,
         context={"source": config_entries.SOURCE_BLUETOOTH},
         data=service_info,
     )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_in_progress"
 
-    p1, p2 = _mock_connection_failure_bleak_error()
-    with p1, p2:
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_PIN: "1234"},
-        )
 
-    assert result["type"] is FlowResultType.FORM
-    assert result["errors"] == {"base": "cannot_connect"}
+async def test_bluetooth_discovery_prunes_expired(hass: HomeAssistant) -> None:
+    """Test expired discovery timestamps are dropped on the next discovery."""
+    recent = hass.data.setdefault(_RECENT_DISCOVERIES, {})
+    recent["aa:bb:cc:dd:ee:00"] = time.monotonic() - _DISCOVERY_DEDUP_WINDOW
+
+    await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_BLUETOOTH},
+        data=make_service_info(),
+    )
 
+    assert recent.keys() == {MOCK_ADDRESS_FORMATTED}
 
-async def test_bluetooth_confirm_cannot_connect_timeout(
-    hass: HomeAssistant,
-) -> None:
-    """Test bluetooth confirm shows error on TimeoutError."""
+
+@pytest.mark.usefixtures("connection_failure")
+async def test_bluetooth_confirm_cannot_connect(hass: HomeAssistant) -> None:
+    """Test bluetooth confirm shows error when the connection test fails."""
     service_info = make_service_info()
 
     result = await hass.config_entries.flow.async_init(
@@ -221,12 +199,10 @@ async def test_bluetooth_confirm_cannot_connect_timeout(
         data=service_info,
     )
 
-    p1, p2 = _mock_connection_failure_timeout()
-    with p1, p2:
-        result = await hass.config_entries.flow.async_configure(
-            result["flow_id"],
-            user_input={CONF_PIN: "1234"},
-        )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_PIN: "1234"},
+    )
 
     assert result["type"] is FlowResultType.FORM
     assert result["errors"] == {"base": "cannot_connect"}
@@ -243,7 +219,7 @@ async def test_bluetooth_confirm_recover_from_error(hass: HomeAssistant) -> None
     )
 
     # First attempt fails
-    p1, p2 = _mock_connection_failure_no_device()
+    p1, p2 = _mock_connection(device_found=False)
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -253,7 +229,7 @@ async def test_bluetooth_confirm_recover_from_error(hass: HomeAssistant) -> None
     assert result["errors"] == {"base": "cannot_connect"}
 
     # Retry succeeds
-    p1, p2 = _mock_connection_success()
+    p1, p2 = _mock_connection()
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -262,6 +238,65 @@ async def test_bluetooth_confirm_recover_from_error(hass: HomeAssistant) -> None
     assert result["type"] is FlowResultType.CREATE_ENTRY
 
 
+async def test_bluetooth_confirm_fresh_advertisement(hass: HomeAssistant) -> None:
+    """Test a fresh connectable advertisement skips the connection test."""
+    service_info = make_service_info()
+    service_info.time = time.monotonic()
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_BLUETOOTH},
+        data=service_info,
+    )
+
+    with (
+        patch(
+            "custom_components.specialized_turbo.config_flow.async_last_service_info",
+            return_value=service_info,
+        ),
+        patch(
+            "custom_components.specialized_turbo.config_flow.establish_connection",
+            new_callable=AsyncMock,
+        ) as mock_establish,
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={},
+        )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    mock_establish.assert_not_called()
+
+
+async def test_bluetooth_confirm_stale_advertisement(hass: HomeAssistant) -> None:
+    """Test a stale advertisement still performs a real connection test."""
+    service_info = make_service_info()
+    service_info.time = time.monotonic() - 60
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_BLUETOOTH},
+        data=service_info,
+    )
+
+    p1, p2 = _mock_connection(device_found=False)
+    with (
+        p1,
+        p2,
+        patch(
+            "custom_components.specialized_turbo.config_flow.async_last_service_info",
+            return_value=service_info,
+        ),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={},
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
 # --- User Flow ---
 
 
@@ -281,7 +316,7 @@ async def test_user_flow(hass: HomeAssistant) -> None:
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user"
 
-    p1, p2 = _mock_connection_success()
+    p1, p2 = _mock_connection()
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -332,6 +367,7 @@ async def test_user_flow_already_configured(hass: HomeAssistant) -> None:
     assert result["reason"] == "no_devices_found"
 
 
+@pytest.mark.usefixtures("connection_failure")
 async def test_user_flow_cannot_connect(hass: HomeAssistant) -> None:
     """Test user flow shows error when connection fails."""
     service_info = make_service_info()
@@ -345,7 +381,57 @@ async def test_user_flow_cannot_connect(hass: HomeAssistant) -> None:
             context={"source": config_entries.SOURCE_USER},
         )
 
-    p1, p2 = _mock_connection_failure_bleak_error()
+    with patch(
+        "custom_components.specialized_turbo.config_flow.async_discovered_service_info",
+        return_value=[service_info],
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            user_input={"address": MOCK_ADDRESS, CONF_PIN: "1234"},
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_user_flow_duplicate_advertisements(hass: HomeAssistant) -> None:
+    """Test a device reported by several scanners is only checked once."""
+    service_info = make_service_info()
+
+    with (
+        patch(
+            "custom_components.specialized_turbo.config_flow.async_discovered_service_info",
+            return_value=[service_info, service_info, service_info],
+        ),
+        patch(
+            "custom_components.specialized_turbo.config_flow._is_specialized_service_info",
+            return_value=True,
+        ) as mock_check,
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_USER},
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    mock_check.assert_called_once_with(service_info)
+
+
+async def test_user_flow_reuses_schema(hass: HomeAssistant) -> None:
+    """Test the user form schema is reused when no new devices appear."""
+    service_info = make_service_info()
+
+    with patch(
+        "custom_components.specialized_turbo.config_flow.async_discovered_service_info",
+        return_value=[service_info],
+    ):
+        result = await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": config_entries.SOURCE_USER},
+        )
+    first_schema = result["data_schema"]
+
+    p1, p2 = _mock_connection(side_effect=BleakError("Connection failed"))
     with (
         p1,
         p2,
@@ -356,11 +442,11 @@ async def test_user_flow_cannot_connect(hass: HomeAssistant) -> None:
     ):
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
-            user_input={"address": MOCK_ADDRESS, CONF_PIN: "1234"},
+            user_input={"address": MOCK_ADDRESS},
         )
 
     assert result["type"] is FlowResultType.FORM
-    assert result["errors"] == {"base": "cannot_connect"}
+    assert result["data_schema"] is first_schema
 
 
 async def test_user_flow_non_specialized_device_filtered(
@@ -460,7 +546,7 @@ async def test_bluetooth_discovery_tcu1(hass: HomeAssistant) -> None:
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "bluetooth_confirm"
 
-    p1, p2 = _mock_connection_success()
+    p1, p2 = _mock_connection()
     with p1, p2:
         result = await hass.config_entries.flow.async_configure(
             result["flow_id"],
@@ -487,3 +573,28 @@ async def test_user_flow_discovers_tcu1(hass: HomeAssistant) -> None:
 
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "user"
+
+
+# --- Advertisement matching ---
+
+
+def test_is_specialized_service_info_cached() -> None:
+    """Test repeated advertisements reuse the cached verdict."""
+    _is_specialized_manufacturer_data.cache_clear()
+    service_info = make_service_info()
+
+    assert _is_specialized_service_info(service_info) is True
+    assert _is_specialized_service_info(service_info) is True
+
+    cache_info = _is_specialized_manufacturer_data.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+
+def test_is_specialized_service_info_skips_foreign_company_id() -> None:
+    """Test advertisements without a Specialized company ID skip the parser."""
+    _is_specialized_manufacturer_data.cache_clear()
+    service_info = make_service_info(manufacturer_data={0x0969: b"TURBOHMI"})
+
+    assert _is_specialized_service_info(service_info) is False
+    assert _is_specialized_manufacturer_data.cache_info().misses == 0
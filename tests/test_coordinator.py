@@ -2,48 +2,96 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import reduce
 import logging
+import time
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from bleak import BleakError
+from bleak import BleakClient, BleakError
 
 from homeassistant.core import HomeAssistant
 
 from custom_components.specialized_turbo.coordinator import (
+    _PARKED_COORDINATORS,
+    _RX_QUEUE_SIZE,
     SpecializedTurboCoordinator,
 )
 from specialized_turbo import CHAR_NOTIFY, CHAR_NOTIFY_TCU1, BLEProfile
 
-from .conftest import MOCK_ADDRESS, MOCK_GEN1_MANUFACTURER_DATA
+from .common import MOCK_ADDRESS, MOCK_GEN1_MANUFACTURER_DATA, make_service_info
 
-_LOGGER = logging.getLogger(__name__)
+# Only handed to the (stubbed) base class; the coordinator itself logs through
+# its module logger, so this one never needs to format anything
+_NULL_LOGGER = logging.getLogger(f"{__name__}.null")
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.propagate = False
 
+# _needs_poll only reads manufacturer_data, to detect the generation
+_SERVICE_INFO = make_service_info(manufacturer_data={})
 
-def _make_coordinator(
-    hass: HomeAssistant, pin: int | None = None
-) -> SpecializedTurboCoordinator:
-    """Create a coordinator with mocked parent class."""
+# Battery charge percent: sender=0x00, channel=0x0C, value=85 (0x55)
+_NOTIFY_BATTERY = bytes((0x00, 0x0C, 0x55))
+# Speed: sender=0x01, channel=0x02, value=255 (25.5 km/h) as 2 bytes LE
+_NOTIFY_SPEED = bytes((0x01, 0x02, 0xFF, 0x00))
+# Too short to parse (< 3 bytes)
+_NOTIFY_SHORT = bytes((0x00,))
+# Unknown sender 0x03
+_NOTIFY_UNKNOWN = bytes((0x03, 0x00, 0x42))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_coordinator_parent_init():
+    """Stub the Bluetooth coordinator base class init for the whole module."""
     with patch(
         "custom_components.specialized_turbo.coordinator.ActiveBluetoothDataUpdateCoordinator.__init__",
         return_value=None,
     ):
-        coord = SpecializedTurboCoordinator(
-            hass, _LOGGER, address=MOCK_ADDRESS, pin=pin
-        )
+        yield
+
+
+def _make_coordinator(
+    hass: HomeAssistant, pin: int | None = None
+) -> SpecializedTurboCoordinator:
+    """Create a coordinator with mocked parent class."""
+    coord = SpecializedTurboCoordinator(
+        hass, _NULL_LOGGER, address=MOCK_ADDRESS, pin=pin
+    )
     coord.hass = hass
     coord.async_update_listeners = MagicMock()
     return coord
 
 
+def _make_client() -> AsyncMock:
+    """Create a mock BleakClient.
+
+    With a spec only the client's coroutine methods become AsyncMocks, so
+    sync members such as ``services`` stay plain MagicMocks. spec_set also
+    rejects assignments to attributes BleakClient does not have.
+    """
+    return AsyncMock(spec_set=BleakClient)
+
+
+def _patch_connection(establish_connection: AsyncMock):
+    """Patch device lookup and establish_connection in the coordinator module."""
+    return patch.multiple(
+        "custom_components.specialized_turbo.coordinator",
+        bluetooth=MagicMock(
+            **{"async_ble_device_from_address.return_value": MagicMock()}
+        ),
+        establish_connection=establish_connection,
+    )
+
+
 # --- needs_poll ---
 
 
 async def test_needs_poll_no_client(hass: HomeAssistant) -> None:
     """Test needs_poll returns True when no client exists."""
     coord = _make_coordinator(hass)
-    assert coord._needs_poll(MagicMock(), None) is True
+    assert coord._needs_poll(_SERVICE_INFO, None) is True
 
 
 async def test_needs_poll_connected(hass: HomeAssistant) -> None:
@@ -52,7 +100,7 @@ async def test_needs_poll_connected(hass: HomeAssistant) -> None:
     mock_client = MagicMock()
     mock_client.is_connected = True
     coord._client = mock_client
-    assert coord._needs_poll(MagicMock(), None) is False
+    assert coord._needs_poll(_SERVICE_INFO, None) is False
 
 
 async def test_needs_poll_disconnected_client(hass: HomeAssistant) -> None:
@@ -61,7 +109,7 @@ async def test_needs_poll_disconnected_client(hass: HomeAssistant) -> None:
     mock_client = MagicMock()
     mock_client.is_connected = False
     coord._client = mock_client
-    assert coord._needs_poll(MagicMock(), None) is True
+    assert coord._needs_poll(_SERVICE_INFO, None) is True
 
 
 async def test_needs_poll_after_disconnect_reconnect(hass: HomeAssistant) -> None:
@@ -73,14 +121,14 @@ async def test_needs_poll_after_disconnect_reconnect(hass: HomeAssistant) -> Non
     mock_client.is_connected = True
     coord._client = mock_client
     coord.snapshot.message_count = 100
-    assert coord._needs_poll(MagicMock(), None) is False
+    assert coord._needs_poll(_SERVICE_INFO, None) is False
 
     # Simulate bike leaving (disconnect callback fires)
     coord._handle_disconnect()
     assert coord._client is None
 
     # Bike comes back in range — needs_poll must return True to reconnect
-    assert coord._needs_poll(MagicMock(), None) is True
+    assert coord._needs_poll(_SERVICE_INFO, None) is True
 
 
 # --- async_poll ---
@@ -98,53 +146,167 @@ async def test_async_poll(hass: HomeAssistant) -> None:
 # --- notification_handler ---
 
 
-async def test_notification_handler_valid(hass: HomeAssistant) -> None:
-    """Test notification handler parses valid data and updates snapshot."""
-    coord = _make_coordinator(hass)
+@pytest.fixture
+def coordinator(hass: HomeAssistant) -> SpecializedTurboCoordinator:
+    """Return a coordinator with a mocked parent class."""
+    return _make_coordinator(hass)
 
-    # Battery charge percent: sender=0x00, channel=0x0C, value=85 (0x55)
-    data = bytearray([0x00, 0x0C, 0x55])
-    coord._handle_notification(bytes(data))
 
-    assert coord.snapshot.battery.charge_pct == 85
-    assert coord.snapshot.message_count == 1
-    coord.async_update_listeners.assert_called_once()
+@pytest.fixture
+def handle_notification(
+    coordinator: SpecializedTurboCoordinator,
+) -> Callable[[bytes], None]:
+    """Return the coordinator's notification parser, bound once."""
+    return coordinator._handle_notification
+
+
+@pytest.mark.parametrize(
+    ("data", "path", "value", "message_count"),
+    [
+        pytest.param(_NOTIFY_BATTERY, ("battery", "charge_pct"), 85, 1, id="valid"),
+        pytest.param(_NOTIFY_SPEED, ("motor", "speed_kmh"), 25.5, 1, id="speed"),
+        pytest.param(_NOTIFY_SHORT, None, None, 0, id="parse_error"),
+        pytest.param(_NOTIFY_UNKNOWN, None, None, 1, id="unknown_field"),
+    ],
+)
+async def test_notification_handler(
+    coordinator: SpecializedTurboCoordinator,
+    handle_notification: Callable[[bytes], None],
+    data: bytes,
+    path: tuple[str, str] | None,
+    value: float | None,
+    message_count: int,
+) -> None:
+    """Test notification handler updates the snapshot and defers the push."""
+    handle_notification(data)
+
+    if path is not None:
+        assert reduce(getattr, path, coordinator.snapshot) == value
+    assert coordinator.snapshot.message_count == message_count
+    coordinator.async_update_listeners.assert_not_called()
+
+    if not message_count:
+        assert coordinator._flush_handle is None
+        return
+    coordinator._async_flush_update()
+    coordinator.async_update_listeners.assert_called_once()
+
+
+async def test_notification_handler_debounces_updates(
+    coordinator: SpecializedTurboCoordinator,
+    handle_notification: Callable[[bytes], None],
+) -> None:
+    """Test a burst of notifications results in a single push to HA."""
+    handle_notification(_NOTIFY_BATTERY)
+    handle = coordinator._flush_handle
+    handle_notification(_NOTIFY_SPEED)
+
+    assert coordinator._flush_handle is handle
+    assert coordinator.snapshot.message_count == 2
+    coordinator.async_update_listeners.assert_not_called()
+
+    coordinator._async_flush_update()
+    coordinator.async_update_listeners.assert_called_once()
+    assert coordinator._flush_handle is None
+
+
+async def test_notification_handler_skips_unchanged_value(
+    coordinator: SpecializedTurboCoordinator,
+    handle_notification: Callable[[bytes], None],
+) -> None:
+    """Test a repeated value does not schedule another push to HA."""
+    handle_notification(_NOTIFY_BATTERY)
+    coordinator._async_flush_update()
+    handle_notification(_NOTIFY_BATTERY)
+
+    assert coordinator.snapshot.message_count == 2
+    assert coordinator._flush_handle is None
+    coordinator.async_update_listeners.assert_called_once()
 
 
-async def test_notification_handler_speed(hass: HomeAssistant) -> None:
-    """Test notification handler with speed value."""
+async def test_notification_after_poll_is_not_a_repeat(
+    coordinator: SpecializedTurboCoordinator,
+    handle_notification: Callable[[bytes], None],
+) -> None:
+    """Test a notification restoring a value overwritten by a poll is pushed."""
+    handle_notification(_NOTIFY_SPEED)
+    coordinator._async_flush_update()
+
+    # Poll reports a different speed: value=100 (10.0 km/h)
+    mock_client = _make_client()
+    mock_client.read_gatt_char.return_value = bytes((0x01, 0x02, 0x64, 0x00))
+    coordinator._client = mock_client
+    coordinator._char_request_write = "request-write"
+    coordinator._char_request_read = "request-read"
+    with patch(
+        "custom_components.specialized_turbo.coordinator.asyncio.sleep",
+        new_callable=AsyncMock,
+    ):
+        await coordinator._poll_tcu1_fields()
+    assert coordinator.snapshot.motor.speed_kmh == 10.0
+
+    handle_notification(_NOTIFY_SPEED)
+
+    assert coordinator.snapshot.motor.speed_kmh == 25.5
+    assert coordinator._flush_handle is not None
+    coordinator._async_flush_update()
+
+
+async def test_enqueue_notification_drops_oldest(hass: HomeAssistant) -> None:
+    """Test the RX buffer drops the oldest frame when full."""
     coord = _make_coordinator(hass)
+    coord._rx_task = hass.async_create_background_task(coord._rx_worker(), "rx")
 
-    # Speed: sender=0x01, channel=0x02, value=255 (25.5 km/h) as 2 bytes LE
-    data = bytearray([0x01, 0x02, 0xFF, 0x00])
-    coord._handle_notification(bytes(data))
+    for i in range(_RX_QUEUE_SIZE + 1):
+        coord._enqueue_notification(bytes([i]))
 
-    assert coord.snapshot.motor.speed_kmh == 25.5
-    assert coord.snapshot.message_count == 1
+    assert len(coord._rx) == _RX_QUEUE_SIZE
+    assert coord._rx[0] == bytes([1])
+    assert coord._rx_wake.is_set()
+
+    # The worker drains the overflowed buffer and keeps running
+    await hass.async_block_till_done()
+    assert not coord._rx
+    assert not coord._rx_task.done()
+    await coord.async_shutdown()
 
 
-async def test_notification_handler_parse_error(hass: HomeAssistant) -> None:
-    """Test notification handler handles parse errors gracefully."""
+async def test_rx_worker_parses_notifications(hass: HomeAssistant) -> None:
+    """Test the RX worker parses buffered notifications."""
     coord = _make_coordinator(hass)
+    coord._rx_task = hass.async_create_background_task(coord._rx_worker(), "rx")
 
-    # Too short to parse (< 3 bytes)
-    data = bytearray([0x00])
-    coord._handle_notification(bytes(data))
+    coord._enqueue_notification(_NOTIFY_BATTERY)
+    coord._enqueue_notification(_NOTIFY_SPEED)
+    await hass.async_block_till_done()
 
-    assert coord.snapshot.message_count == 0
-    coord.async_update_listeners.assert_not_called()
+    assert coord.snapshot.battery.charge_pct == 85
+    assert coord.snapshot.motor.speed_kmh == 25.5
+    assert not coord._rx
+    await coord.async_shutdown()
+    assert coord._rx_task is None
 
 
-async def test_notification_handler_unknown_field(hass: HomeAssistant) -> None:
-    """Test notification handler handles unknown fields."""
+async def test_rx_worker_survives_handler_error(hass: HomeAssistant) -> None:
+    """Test a frame that raises does not stop the next frame being handled."""
     coord = _make_coordinator(hass)
+    handle_notification = coord._handle_notification
 
-    # Unknown sender 0x03
-    data = bytearray([0x03, 0x00, 0x42])
-    coord._handle_notification(bytes(data))
+    def _handle(data: bytes) -> None:
+        if data == _NOTIFY_UNKNOWN:
+            raise RuntimeError("parser bug")
+        handle_notification(data)
 
-    assert coord.snapshot.message_count == 1
-    coord.async_update_listeners.assert_called_once()
+    coord._handle_notification = _handle
+    coord._rx_task = hass.async_create_background_task(coord._rx_worker(), "rx")
+
+    coord._enqueue_notification(_NOTIFY_UNKNOWN)
+    coord._enqueue_notification(_NOTIFY_BATTERY)
+    await hass.async_block_till_done()
+
+    assert coord.snapshot.battery.charge_pct == 85
+    assert not coord._rx_task.done()
+    await coord.async_shutdown()
 
 
 # --- ensure_connected ---
@@ -193,126 +355,63 @@ async def test_ensure_connected_device_not_found_no_repeat_log(
     assert coord._was_unavailable is True
 
 
-async def test_ensure_connected_success(hass: HomeAssistant) -> None:
-    """Test ensure_connected connects and subscribes to notifications."""
-    coord = _make_coordinator(hass)
-
-    mock_client = AsyncMock()
-    mock_client.is_connected = True
-
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
-        await coord._ensure_connected()
-
-    assert coord._client is mock_client
-    mock_client.start_notify.assert_called_once_with(
-        CHAR_NOTIFY, coord._notification_handler
-    )
+@pytest.fixture
+def connected_client():
+    """Patch device lookup and connection to hand out a mock BleakClient."""
+    mock_client = _make_client()
+    with _patch_connection(AsyncMock(return_value=mock_client)):
+        yield mock_client
 
 
-async def test_ensure_connected_reconnect_after_unavailable(
+@pytest.mark.parametrize(
+    ("pin", "was_unavailable", "pair_side_effect"),
+    [
+        pytest.param(None, False, None, id="success"),
+        pytest.param(None, True, None, id="reconnect_after_unavailable"),
+        pytest.param(1234, False, None, id="with_pin"),
+        pytest.param(1234, False, NotImplementedError, id="pairing_not_implemented"),
+        pytest.param(1234, False, RuntimeError("Pair failed"), id="pairing_error"),
+    ],
+)
+async def test_ensure_connected(
     hass: HomeAssistant,
+    connected_client: AsyncMock,
+    pin: int | None,
+    was_unavailable: bool,
+    pair_side_effect: type[Exception] | Exception | None,
 ) -> None:
-    """Test that reconnection after unavailable clears the flag."""
-    coord = _make_coordinator(hass)
-    coord._was_unavailable = True
-
-    mock_client = AsyncMock()
+    """Test ensure_connected connects, pairs when needed and subscribes."""
+    coord = _make_coordinator(hass, pin=pin)
+    coord._was_unavailable = was_unavailable
+    connected_client.pair.side_effect = pair_side_effect
 
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
-        await coord._ensure_connected()
+    await coord._ensure_connected()
 
+    assert coord._client is connected_client
     assert coord._was_unavailable is False
-    assert coord._client is mock_client
-
-
-async def test_ensure_connected_with_pin(hass: HomeAssistant) -> None:
-    """Test ensure_connected triggers pairing when PIN is set."""
-    coord = _make_coordinator(hass, pin=1234)
-
-    mock_client = AsyncMock()
-
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
-        await coord._ensure_connected()
-
-    mock_client.pair.assert_called_once_with(protection_level=2)
+    if pin is None:
+        connected_client.pair.assert_not_called()
+    else:
+        connected_client.pair.assert_called_once_with(protection_level=2)
+    connected_client.start_notify.assert_called_once_with(
+        CHAR_NOTIFY, coord._notification_handler
+    )
 
 
-async def test_ensure_connected_pairing_not_implemented(
-    hass: HomeAssistant,
+async def test_ensure_connected_subscribes_by_uuid_on_reconnect(
+    hass: HomeAssistant, connected_client: AsyncMock
 ) -> None:
-    """Test pairing gracefully handles NotImplementedError."""
-    coord = _make_coordinator(hass, pin=1234)
-
-    mock_client = AsyncMock()
-    mock_client.pair.side_effect = NotImplementedError
-
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
-        await coord._ensure_connected()
-
-    mock_client.start_notify.assert_called_once()
-
-
-async def test_ensure_connected_pairing_error(hass: HomeAssistant) -> None:
-    """Test pairing gracefully handles generic errors."""
-    coord = _make_coordinator(hass, pin=1234)
-
-    mock_client = AsyncMock()
-    mock_client.pair.side_effect = RuntimeError("Pair failed")
+    """Test every reconnect subscribes by UUID rather than a stale handle."""
+    coord = _make_coordinator(hass)
 
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
-        await coord._ensure_connected()
+    await coord._ensure_connected()
+    connected_client.is_connected = False
+    await coord._ensure_connected()
 
-    mock_client.start_notify.assert_called_once()
+    assert connected_client.start_notify.call_count == 2
+    connected_client.start_notify.assert_called_with(
+        CHAR_NOTIFY, coord._notification_handler
+    )
 
 
 # --- connected property ---
@@ -342,25 +441,49 @@ async def test_connected_when_disconnected(hass: HomeAssistant) -> None:
     assert coord.connected is False
 
 
-# --- on_disconnect ---
+# --- diagnostics snapshot ---
 
 
-async def test_on_disconnect(hass: HomeAssistant) -> None:
-    """Test disconnect callback sets unavailable flag and notifies listeners."""
+async def test_diagnostics_snapshot_structure(hass: HomeAssistant) -> None:
+    """Test the diagnostics snapshot lists every state model's fields."""
     coord = _make_coordinator(hass)
-    coord._client = MagicMock()
+    coord.snapshot.message_count = 42
+    coord.snapshot.battery.charge_pct = 80
+    coord.snapshot.motor.speed_kmh = 25.0
+    coord.snapshot.settings.assist_lev1_pct = 30
 
-    coord._handle_disconnect()
+    data = coord.async_diagnostics_snapshot()
 
-    assert coord._was_unavailable is True
-    assert coord._client is None
-    coord.async_update_listeners.assert_called_once()
+    assert data["message_count"] == 42
+    assert data["battery"]["charge_pct"] == 80
+    assert data["motor"]["speed_kmh"] == 25.0
+    assert data["settings"]["assist_lev1_pct"] == 30
+    assert "system" in data
 
 
-async def test_on_disconnect_already_unavailable(hass: HomeAssistant) -> None:
-    """Test disconnect when already unavailable doesn't re-log."""
+async def test_diagnostics_snapshot_cached(hass: HomeAssistant) -> None:
+    """Test the snapshot dict is reused until a new message arrives."""
     coord = _make_coordinator(hass)
-    coord._was_unavailable = True
+
+    first = coord.async_diagnostics_snapshot()
+    assert first["message_count"] == 0
+    assert coord.async_diagnostics_snapshot() is first
+
+    coord.snapshot.message_count = 1
+    coord.snapshot.battery.charge_pct = 50
+    second = coord.async_diagnostics_snapshot()
+    assert second is not first
+    assert second["battery"]["charge_pct"] == 50
+
+
+# --- on_disconnect ---
+
+
+@pytest.mark.parametrize("was_unavailable", [False, True])
+async def test_on_disconnect(hass: HomeAssistant, was_unavailable: bool) -> None:
+    """Test disconnect callback sets unavailable flag and notifies listeners."""
+    coord = _make_coordinator(hass)
+    coord._was_unavailable = was_unavailable
     coord._client = MagicMock()
 
     coord._handle_disconnect()
@@ -373,41 +496,120 @@ async def test_on_disconnect_already_unavailable(hass: HomeAssistant) -> None:
 # --- async_shutdown ---
 
 
-async def test_async_shutdown_connected(hass: HomeAssistant) -> None:
-    """Test shutdown cleanly disconnects a connected client."""
+@pytest.mark.parametrize(
+    ("connected", "error"),
+    [
+        pytest.param(True, None, id="connected"),
+        pytest.param(True, Exception("cleanup error"), id="errors"),
+        pytest.param(False, None, id="not_connected"),
+    ],
+)
+async def test_async_shutdown(
+    hass: HomeAssistant, connected: bool, error: Exception | None
+) -> None:
+    """Test shutdown parks a live connection and disconnects after the grace period."""
     coord = _make_coordinator(hass)
-    mock_client = AsyncMock()
-    mock_client.is_connected = True
+    mock_client = _make_client()
+    mock_client.is_connected = connected
+    mock_client.stop_notify.side_effect = error
+    mock_client.disconnect.side_effect = error
     coord._client = mock_client
 
     await coord.async_shutdown()
 
+    if not connected:
+        mock_client.stop_notify.assert_not_called()
+        assert coord._client is None
+        return
+
     mock_client.stop_notify.assert_called_once_with(CHAR_NOTIFY)
+    mock_client.disconnect.assert_not_called()
+    assert hass.data[_PARKED_COORDINATORS][MOCK_ADDRESS] is coord
+
+    coord._disconnect_handle.cancel()
+    coord._async_deferred_disconnect()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
     mock_client.disconnect.assert_called_once()
     assert coord._client is None
+    assert MOCK_ADDRESS not in hass.data[_PARKED_COORDINATORS]
+
 
+async def test_ensure_connected_reuses_parked_client(hass: HomeAssistant) -> None:
+    """Test a new coordinator adopts the connection parked by the previous one."""
+    old = _make_coordinator(hass)
+    mock_client = _make_client()
+    mock_client.is_connected = True
+    old._client = mock_client
+    await old.async_shutdown()
 
-async def test_async_shutdown_not_connected(hass: HomeAssistant) -> None:
-    """Test shutdown with no active connection."""
     coord = _make_coordinator(hass)
+    with patch(
+        "custom_components.specialized_turbo.coordinator.establish_connection",
+        new_callable=AsyncMock,
+    ) as mock_establish:
+        await coord._ensure_connected()
 
-    await coord.async_shutdown()
+    mock_establish.assert_not_called()
+    assert coord._client is mock_client
+    assert old._client is None
+    assert old._disconnect_handle is None
+    mock_client.start_notify.assert_called_once_with(
+        CHAR_NOTIFY, coord._notification_handler
+    )
 
+    # Disconnects reported to the old coordinator reach the new one
+    old._handle_disconnect()
     assert coord._client is None
+    coord.async_update_listeners.assert_called_once()
+    assert old._successor is None
+    assert coord._disconnect_owner is None
 
 
-async def test_async_shutdown_errors(hass: HomeAssistant) -> None:
-    """Test shutdown handles errors during cleanup."""
-    coord = _make_coordinator(hass)
-    mock_client = AsyncMock()
+async def test_repeated_reloads_forward_disconnect_in_one_hop(
+    hass: HomeAssistant,
+) -> None:
+    """Test the callback owner points straight at the newest adopter."""
+    first = _make_coordinator(hass)
+    mock_client = _make_client()
     mock_client.is_connected = True
-    mock_client.stop_notify.side_effect = Exception("stop error")
-    mock_client.disconnect.side_effect = Exception("disconnect error")
-    coord._client = mock_client
+    first._client = mock_client
+
+    second = _make_coordinator(hass)
+    third = _make_coordinator(hass)
+    for previous, current in ((first, second), (second, third)):
+        await previous.async_shutdown()
+        with patch(
+            "custom_components.specialized_turbo.coordinator.establish_connection",
+            new_callable=AsyncMock,
+        ):
+            await current._ensure_connected()
+
+    assert first._successor is third
+    assert second._successor is None
+    assert second._disconnect_owner is None
+    assert third._disconnect_owner is first
+
+    # The newest coordinator is parked when the link drops on its own
+    await third.async_shutdown()
+    first._handle_disconnect()
+
+    assert first._successor is None
+    assert third._client is None
+    assert third._disconnect_handle is None
+    assert MOCK_ADDRESS not in hass.data[_PARKED_COORDINATORS]
+
+
+async def test_async_shutdown_cancels_pending_update(hass: HomeAssistant) -> None:
+    """Test shutdown cancels a pending debounced update."""
+    coord = _make_coordinator(hass)
+    coord._handle_notification(_NOTIFY_BATTERY)
+    handle = coord._flush_handle
 
     await coord.async_shutdown()
 
-    assert coord._client is None
+    assert handle.cancelled()
+    assert coord._flush_handle is None
 
 
 # --- BleakError handling in _do_poll ---
@@ -417,20 +619,12 @@ async def test_do_poll_bleak_error_from_start_notify(hass: HomeAssistant) -> Non
     """Test that BleakError during start_notify propagates and client is cleared."""
     coord = _make_coordinator(hass)
 
-    mock_client = AsyncMock()
+    mock_client = _make_client()
     mock_client.is_connected = True
     mock_client.start_notify.side_effect = BleakError("Not connected")
 
     with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
+        _patch_connection(AsyncMock(return_value=mock_client)),
         pytest.raises(BleakError),
     ):
         await coord._do_poll()
@@ -445,15 +639,7 @@ async def test_do_poll_bleak_error_from_establish_connection(
     coord = _make_coordinator(hass)
 
     with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            side_effect=BleakError("Failed to connect"),
-        ),
+        _patch_connection(AsyncMock(side_effect=BleakError("Failed to connect"))),
         pytest.raises(BleakError),
     ):
         await coord._do_poll()
@@ -461,6 +647,55 @@ async def test_do_poll_bleak_error_from_establish_connection(
     assert coord._client is None
 
 
+async def test_do_poll_bleak_error_backs_off(hass: HomeAssistant) -> None:
+    """Test a failed connection delays the next attempt and doubles the backoff."""
+    coord = _make_coordinator(hass)
+
+    mock_establish = AsyncMock(side_effect=BleakError("Failed to connect"))
+    with _patch_connection(mock_establish), pytest.raises(BleakError):
+        await coord._do_poll()
+
+    assert coord._reconnect_backoff == 2.0
+    # Still inside the backoff window — no new connection attempt
+    assert coord._needs_poll(_SERVICE_INFO, None) is False
+    mock_establish.assert_called_once()
+
+    coord._next_connect_time = 0
+    assert coord._needs_poll(_SERVICE_INFO, None) is True
+
+
+async def test_no_poll_during_backoff(hass: HomeAssistant) -> None:
+    """Test a backed-off reconnect is not reported as a recovered poll."""
+    coord = _make_coordinator(hass)
+    coord.last_poll_successful = False
+    coord._next_connect_time = time.monotonic() + 60
+
+    mock_establish = AsyncMock()
+    with _patch_connection(mock_establish):
+        # Mirror the base class: it only polls when _needs_poll asks for it,
+        # and treats a poll that returns normally as recovered.
+        if coord._needs_poll(_SERVICE_INFO, None):
+            await coord._do_poll()
+            coord.last_poll_successful = True
+            coord.async_update_listeners()
+
+    mock_establish.assert_not_called()
+    assert coord.last_poll_successful is False
+    coord.async_update_listeners.assert_not_called()
+
+
+async def test_ensure_connected_resets_backoff(hass: HomeAssistant) -> None:
+    """Test a successful connection resets the reconnect backoff."""
+    coord = _make_coordinator(hass)
+    coord._reconnect_backoff = 64.0
+
+    with _patch_connection(AsyncMock(return_value=_make_client())):
+        await coord._ensure_connected()
+
+    assert coord._reconnect_backoff == 1.0
+    assert coord._next_connect_time == 0
+
+
 # --- TCU1 support ---
 
 
@@ -480,20 +715,10 @@ async def test_ensure_connected_tcu1_uses_tcu1_char_notify(
     coord = _make_coordinator(hass)
     coord._generation = BLEProfile.TCU1
 
-    mock_client = AsyncMock()
+    mock_client = _make_client()
     mock_client.is_connected = True
 
-    with (
-        patch(
-            "custom_components.specialized_turbo.coordinator.bluetooth.async_ble_device_from_address",
-            return_value=MagicMock(),
-        ),
-        patch(
-            "custom_components.specialized_turbo.coordinator.establish_connection",
-            new_callable=AsyncMock,
-            return_value=mock_client,
-        ),
-    ):
+    with _patch_connection(AsyncMock(return_value=mock_client)):
         await coord._ensure_connected()
 
     mock_client.start_notify.assert_called_once_with(
@@ -507,13 +732,14 @@ async def test_tcu1_notification_with_ff_padding(hass: HomeAssistant) -> None:
     coord._generation = BLEProfile.TCU1
 
     # 01 05 01 00 FF FF... → assist_level ECO, padded with FF
-    data = bytearray.fromhex("01050100" + "ff" * 16)
-    coord._handle_notification(bytes(data))
+    data = bytes.fromhex("01050100" + "ff" * 16)
+    coord._handle_notification(data)
 
     from specialized_turbo import AssistLevel
 
     assert coord.snapshot.motor.assist_level == AssistLevel.ECO
     assert coord.snapshot.message_count == 1
+    coord._async_flush_update()
 
 
 # --- TCX support ---
@@ -530,6 +756,7 @@ async def test_tcx_notification_with_f8ff_prefix(hass: HomeAssistant) -> None:
 
     assert coord.snapshot.system.system_state == 5
     assert coord.snapshot.message_count == 1
+    coord._async_flush_update()
     coord.async_update_listeners.assert_called_once()
 
 
@@ -547,3 +774,4 @@ async def test_tcx_notification_without_f8ff_prefix(hass: HomeAssistant) -> None
 
     assert coord.snapshot.battery.charge_pct == 52
     assert coord.snapshot.message_count == 1
+    coord._async_flush_update()
@@ -4,81 +4,54 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.specialized_turbo.const import CONF_PIN, DOMAIN
+from custom_components.specialized_turbo.const import CONF_PIN
 from custom_components.specialized_turbo.diagnostics import (
     async_get_config_entry_diagnostics,
 )
-from specialized_turbo import TelemetrySnapshot
 
-from .conftest import MOCK_ADDRESS, MOCK_ADDRESS_FORMATTED
+from .common import MOCK_ADDRESS, MOCK_ENTRY_DATA_NO_PIN
 
 
-async def test_diagnostics_structure(hass: HomeAssistant) -> None:
+async def test_diagnostics_structure(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
     """Test diagnostics output has the expected structure."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
-
-    snapshot = TelemetrySnapshot()
-    snapshot.message_count = 42
-    snapshot.battery.charge_pct = 80
-    snapshot.battery.voltage_v = 36.5
-    snapshot.motor.speed_kmh = 25.0
-    snapshot.settings.assist_lev1_pct = 30
-
+    snapshot_data = {"message_count": 42}
     mock_coordinator = MagicMock()
-    mock_coordinator.snapshot = snapshot
-    entry.runtime_data = mock_coordinator
+    mock_coordinator.async_diagnostics_snapshot.return_value = snapshot_data
+    config_entry.runtime_data = mock_coordinator
 
-    result = await async_get_config_entry_diagnostics(hass, entry)
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
 
-    assert "entry" in result
-    assert "snapshot" in result
-    assert result["snapshot"]["message_count"] == 42
-    assert result["snapshot"]["battery"]["charge_pct"] == 80
-    assert result["snapshot"]["motor"]["speed_kmh"] == 25.0
-    assert result["snapshot"]["settings"]["assist_lev1_pct"] == 30
+    assert result["entry"]["data"][CONF_ADDRESS] == MOCK_ADDRESS
+    assert result["snapshot"] is snapshot_data
 
 
-async def test_diagnostics_redacts_pin(hass: HomeAssistant) -> None:
+async def test_diagnostics_redacts_pin(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
     """Test that PIN is redacted in diagnostics output."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
+    config_entry.runtime_data = MagicMock()
 
-    mock_coordinator = MagicMock()
-    mock_coordinator.snapshot = TelemetrySnapshot()
-    entry.runtime_data = mock_coordinator
-
-    result = await async_get_config_entry_diagnostics(hass, entry)
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
 
     assert result["entry"]["data"][CONF_PIN] == "**REDACTED**"
     assert result["entry"]["data"][CONF_ADDRESS] == MOCK_ADDRESS
 
 
-async def test_diagnostics_empty_snapshot(hass: HomeAssistant) -> None:
-    """Test diagnostics with an empty snapshot."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
-
-    mock_coordinator = MagicMock()
-    mock_coordinator.snapshot = TelemetrySnapshot()
-    entry.runtime_data = mock_coordinator
+@pytest.mark.parametrize("config_entry", [MOCK_ENTRY_DATA_NO_PIN], indirect=True)
+async def test_diagnostics_without_pin(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
+    """Test an entry without a PIN is reported unchanged."""
+    config_entry.runtime_data = MagicMock()
 
-    result = await async_get_config_entry_diagnostics(hass, entry)
+    result = await async_get_config_entry_diagnostics(hass, config_entry)
 
-    assert result["snapshot"]["message_count"] == 0
+    assert CONF_PIN not in result["entry"]["data"]
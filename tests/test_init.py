@@ -4,27 +4,27 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from specialized_turbo import TelemetrySnapshot
 
-from custom_components.specialized_turbo.const import CONF_PIN, DOMAIN
-
-from .conftest import MOCK_ADDRESS, MOCK_ADDRESS_FORMATTED
-
+from .common import MOCK_ENTRY_DATA, MOCK_ENTRY_DATA_NO_PIN
 
-async def test_setup_entry(hass: HomeAssistant) -> None:
-    """Test successful setup of a config entry."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
 
+@pytest.mark.parametrize(
+    "config_entry",
+    [
+        pytest.param(MOCK_ENTRY_DATA, id="pin"),
+        pytest.param(MOCK_ENTRY_DATA_NO_PIN, id="no_pin"),
+    ],
+    indirect=True,
+)
+async def test_setup_entry(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
+    """Test successful setup of a config entry, with and without a PIN."""
     mock_coordinator = MagicMock()
     mock_coordinator.snapshot = TelemetrySnapshot()
     mock_coordinator.async_start.return_value = lambda: None
@@ -34,22 +34,17 @@ async def test_setup_entry(hass: HomeAssistant) -> None:
         "custom_components.specialized_turbo.SpecializedTurboCoordinator",
         return_value=mock_coordinator,
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.LOADED
-    assert entry.runtime_data is mock_coordinator
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert config_entry.runtime_data is mock_coordinator
 
 
-async def test_setup_entry_device_not_in_range(hass: HomeAssistant) -> None:
+async def test_setup_entry_device_not_in_range(
+    hass: HomeAssistant, config_entry: MockConfigEntry
+) -> None:
     """Test setup succeeds even when bike is not in BLE range."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
-
     mock_coordinator = MagicMock()
     mock_coordinator.snapshot = TelemetrySnapshot()
     mock_coordinator.async_start.return_value = lambda: None
@@ -59,45 +54,14 @@ async def test_setup_entry_device_not_in_range(hass: HomeAssistant) -> None:
         "custom_components.specialized_turbo.SpecializedTurboCoordinator",
         return_value=mock_coordinator,
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.config_entries.async_setup(config_entry.entry_id)
         await hass.async_block_till_done()
 
-    assert entry.state is ConfigEntryState.LOADED
-
+    assert config_entry.state is ConfigEntryState.LOADED
 
-async def test_setup_entry_no_pin(hass: HomeAssistant) -> None:
-    """Test setup entry without a PIN."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
 
-    mock_coordinator = MagicMock()
-    mock_coordinator.snapshot = TelemetrySnapshot()
-    mock_coordinator.async_start.return_value = lambda: None
-    mock_coordinator.async_shutdown = AsyncMock()
-
-    with patch(
-        "custom_components.specialized_turbo.SpecializedTurboCoordinator",
-        return_value=mock_coordinator,
-    ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-    assert entry.state is ConfigEntryState.LOADED
-
-
-async def test_unload_entry(hass: HomeAssistant) -> None:
+async def test_unload_entry(hass: HomeAssistant, config_entry: MockConfigEntry) -> None:
     """Test successful unloading of a config entry."""
-    entry = MockConfigEntry(
-        domain=DOMAIN,
-        data={CONF_ADDRESS: MOCK_ADDRESS, CONF_PIN: 1234},
-        unique_id=MOCK_ADDRESS_FORMATTED,
-    )
-    entry.add_to_hass(hass)
-
     mock_coordinator = MagicMock()
     mock_coordinator.snapshot = TelemetrySnapshot()
     mock_coordinator.async_start.return_value = lambda: None
@@ -107,12 +71,10 @@ async def test_unload_entry(hass: HomeAssistant) -> None:
         "custom_components.specialized_turbo.SpecializedTurboCoordinator",
         return_value=mock_coordinator,
     ):
-        await hass.config_entries.async_setup(entry.entry_id)
-        await hass.async_block_till_done()
-
-        result = await hass.config_entries.async_unload(entry.entry_id)
+        await hass.config_entries.async_setup(config_entry.entry_id)
+        result = await hass.config_entries.async_unload(config_entry.entry_id)
         await hass.async_block_till_done()
 
     assert result is True
-    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert config_entry.state is ConfigEntryState.NOT_LOADED
     mock_coordinator.async_shutdown.assert_called_once()
@@ -2,161 +2,77 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, DeviceInfo
+import pytest
 from specialized_turbo import AssistLevel, TelemetrySnapshot
 
 from custom_components.specialized_turbo.sensor import (
     PARALLEL_UPDATES,
     SENSOR_DESCRIPTIONS,
+    SpecializedTurboSensor,
     _assist_level_name,
+    async_setup_entry,
 )
 
+from .common import MOCK_ADDRESS, MOCK_ADDRESS_FORMATTED, MOCK_ENTRY_DATA, MOCK_NAME
 
-# --- Value function tests ---
-
-
-def test_battery_charge_pct() -> None:
-    """Test battery charge percent value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.charge_pct = 85
-    desc = _get_desc("battery_charge_percent")
-    assert desc.value_fn(snap) == 85
-
-
-def test_battery_capacity_wh() -> None:
-    """Test battery capacity value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.capacity_wh = 604.0
-    desc = _get_desc("battery_capacity_wh")
-    assert desc.value_fn(snap) == 604.0
-
-
-def test_battery_remaining_wh() -> None:
-    """Test battery remaining value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.remaining_wh = 302.0
-    desc = _get_desc("battery_remaining_wh")
-    assert desc.value_fn(snap) == 302.0
-
-
-def test_battery_health() -> None:
-    """Test battery health value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.health_pct = 95
-    desc = _get_desc("battery_health")
-    assert desc.value_fn(snap) == 95
+pytestmark = pytest.mark.sensor_pure
 
+_DESC_BY_KEY = {desc.key: desc for desc in SENSOR_DESCRIPTIONS}
 
-def test_battery_temp() -> None:
-    """Test battery temperature value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.temp_c = 25
-    desc = _get_desc("battery_temp")
-    assert desc.value_fn(snap) == 25
 
+@pytest.fixture(scope="module")
+def empty_snapshot() -> TelemetrySnapshot:
+    """Return one empty snapshot shared by the read-only tests.
 
-def test_battery_charge_cycles() -> None:
-    """Test battery charge cycles value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.charge_cycles = 150
-    desc = _get_desc("battery_charge_cycles")
-    assert desc.value_fn(snap) == 150
-
-
-def test_battery_voltage() -> None:
-    """Test battery voltage value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.voltage_v = 36.5
-    desc = _get_desc("battery_voltage")
-    assert desc.value_fn(snap) == 36.5
-
-
-def test_battery_current() -> None:
-    """Test battery current value function."""
-    snap = TelemetrySnapshot()
-    snap.battery.current_a = 5.0
-    desc = _get_desc("battery_current")
-    assert desc.value_fn(snap) == 5.0
-
-
-def test_speed() -> None:
-    """Test speed value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.speed_kmh = 25.5
-    desc = _get_desc("speed")
-    assert desc.value_fn(snap) == 25.5
-
-
-def test_rider_power() -> None:
-    """Test rider power value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.rider_power_w = 150.0
-    desc = _get_desc("rider_power")
-    assert desc.value_fn(snap) == 150.0
-
-
-def test_motor_power() -> None:
-    """Test motor power value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.motor_power_w = 250.0
-    desc = _get_desc("motor_power")
-    assert desc.value_fn(snap) == 250.0
+    Tests that set fields build their own, since the nested state objects
+    would otherwise leak between tests.
+    """
+    return TelemetrySnapshot()
 
 
-def test_cadence() -> None:
-    """Test cadence value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.cadence_rpm = 80.0
-    desc = _get_desc("cadence")
-    assert desc.value_fn(snap) == 80.0
-
-
-def test_odometer() -> None:
-    """Test odometer value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.odometer_km = 1234.5
-    desc = _get_desc("odometer")
-    assert desc.value_fn(snap) == 1234.5
-
-
-def test_motor_temp() -> None:
-    """Test motor temperature value function."""
-    snap = TelemetrySnapshot()
-    snap.motor.motor_temp_c = 45
-    desc = _get_desc("motor_temp")
-    assert desc.value_fn(snap) == 45
-
-
-def test_assist_eco_pct() -> None:
-    """Test ECO assist percentage value function."""
-    snap = TelemetrySnapshot()
-    snap.settings.assist_lev1_pct = 30
-    desc = _get_desc("assist_eco_pct")
-    assert desc.value_fn(snap) == 30
-
-
-def test_assist_trail_pct() -> None:
-    """Test trail assist percentage value function."""
-    snap = TelemetrySnapshot()
-    snap.settings.assist_lev2_pct = 60
-    desc = _get_desc("assist_trail_pct")
-    assert desc.value_fn(snap) == 60
+# --- Value function tests ---
 
 
-def test_assist_turbo_pct() -> None:
-    """Test turbo assist percentage value function."""
+@pytest.mark.parametrize(
+    ("key", "component", "attr", "value"),
+    [
+        ("battery_charge_percent", "battery", "charge_pct", 85),
+        ("battery_capacity_wh", "battery", "capacity_wh", 604.0),
+        ("battery_remaining_wh", "battery", "remaining_wh", 302.0),
+        ("battery_health", "battery", "health_pct", 95),
+        ("battery_temp", "battery", "temp_c", 25),
+        ("battery_charge_cycles", "battery", "charge_cycles", 150),
+        ("battery_voltage", "battery", "voltage_v", 36.5),
+        ("battery_current", "battery", "current_a", 5.0),
+        ("speed", "motor", "speed_kmh", 25.5),
+        ("rider_power", "motor", "rider_power_w", 150.0),
+        ("motor_power", "motor", "motor_power_w", 250.0),
+        ("cadence", "motor", "cadence_rpm", 80.0),
+        ("odometer", "motor", "odometer_km", 1234.5),
+        ("motor_temp", "motor", "motor_temp_c", 45),
+        ("assist_eco_pct", "settings", "assist_lev1_pct", 30),
+        ("assist_trail_pct", "settings", "assist_lev2_pct", 60),
+        ("assist_turbo_pct", "settings", "assist_lev3_pct", 100),
+    ],
+)
+def test_value_fn(key: str, component: str, attr: str, value: float) -> None:
+    """Test each value function reads its snapshot field."""
     snap = TelemetrySnapshot()
-    snap.settings.assist_lev3_pct = 100
-    desc = _get_desc("assist_turbo_pct")
-    assert desc.value_fn(snap) == 100
+    setattr(getattr(snap, component), attr, value)
+    desc = _DESC_BY_KEY[key]
+    assert desc.value_fn(snap) == value
 
 
 # --- Assist level name function ---
 
 
-def test_assist_level_name_none() -> None:
+def test_assist_level_name_none(empty_snapshot: TelemetrySnapshot) -> None:
     """Test assist level name when None."""
-    snap = TelemetrySnapshot()
-    assert _assist_level_name(snap) is None
+    assert _assist_level_name(empty_snapshot) is None
 
 
 def test_assist_level_name_off() -> None:
@@ -213,20 +129,66 @@ def test_all_descriptions_have_translation_key() -> None:
         assert desc.translation_key is not None, f"{desc.key} missing translation_key"
 
 
-def test_value_fn_returns_none_for_empty_snapshot() -> None:
+def test_value_fn_returns_none_for_empty_snapshot(
+    empty_snapshot: TelemetrySnapshot,
+) -> None:
     """Test that all value functions handle empty snapshot gracefully."""
-    snap = TelemetrySnapshot()
     for desc in SENSOR_DESCRIPTIONS:
-        value = desc.value_fn(snap)
+        value = desc.value_fn(empty_snapshot)
         assert value is None, f"{desc.key} returned {value} for empty snapshot"
 
 
-# --- Helper ---
+# --- Entity tests ---
 
 
-def _get_desc(key: str):
-    """Get a sensor description by key."""
-    for desc in SENSOR_DESCRIPTIONS:
-        if desc.key == key:
-            return desc
-    raise KeyError(f"No sensor description with key {key}")
+def _make_sensor(key: str = "speed") -> SpecializedTurboSensor:
+    """Create a sensor backed by a connected mock coordinator with no data."""
+    coordinator = MagicMock(connected=True, snapshot=TelemetrySnapshot())
+    return SpecializedTurboSensor(
+        coordinator, _DESC_BY_KEY[key], MOCK_ADDRESS_FORMATTED, DeviceInfo()
+    )
+
+
+def test_sensor_unavailable_before_data() -> None:
+    """Test a connected sensor stays unavailable until a message arrives."""
+    assert _make_sensor().available is False
+
+
+def test_sensor_available_after_data() -> None:
+    """Test a sensor becomes available once the snapshot has messages."""
+    sensor = _make_sensor()
+    sensor.coordinator.snapshot.message_count = 1
+    assert sensor.available is True
+
+
+def test_sensor_unavailable_when_disconnected() -> None:
+    """Test a sensor that has seen data goes unavailable on disconnect."""
+    sensor = _make_sensor()
+    sensor.coordinator.snapshot.message_count = 1
+    assert sensor.available is True
+
+    sensor.coordinator.connected = False
+    assert sensor.available is False
+
+
+async def test_setup_entry_unique_id_and_device_info() -> None:
+    """Test entities keep the unique ID and device info format of earlier releases."""
+    coordinator = MagicMock(connected=True, snapshot=TelemetrySnapshot())
+    entry = SimpleNamespace(
+        runtime_data=coordinator, data=MOCK_ENTRY_DATA, title=MOCK_NAME
+    )
+    async_add_entities = MagicMock()
+
+    await async_setup_entry(MagicMock(), entry, async_add_entities)
+
+    sensors = list(async_add_entities.call_args.args[0])
+    assert len(sensors) == len(SENSOR_DESCRIPTIONS)
+    for sensor in sensors:
+        key = sensor.entity_description.key
+        assert sensor.unique_id == f"{MOCK_ADDRESS_FORMATTED}_{key}"
+        assert sensor.device_info == DeviceInfo(
+            connections={(CONNECTION_BLUETOOTH, MOCK_ADDRESS)},
+            name=MOCK_NAME,
+            manufacturer="Specialized",
+            model="Turbo",
+        )